@@ -22,14 +22,15 @@ Currently supported device type:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import socket
+from collections.abc import Callable
 from typing import Any
 
 from homeassistant import config_entries
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.json import json_loads
 
 from .const import (
     CONF_DEVICE_ID,
@@ -40,18 +41,25 @@ from .const import (
     DOMAIN,
     ENTRY_TYPE_DEVICE,
     ENTRY_TYPE_LISTENER,
-    SIGNAL_DATA_RECEIVED,
-    SUPPORTED_DEVICE_TYPES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[str] = ["sensor"]
 
+# Accept queue size for the listening socket. asyncio defaults to 100, which a
+# fleet of devices reconnecting at once (e.g. after a HA restart) can overflow;
+# the kernel silently caps this at net.core.somaxconn.
+_LISTEN_BACKLOG = 1024
 
-def _data_signal(device_id: str) -> str:
-    """Create the dispatcher signal name for a device."""
-    return f"{SIGNAL_DATA_RECEIVED}_{device_id}"
+# Upper bound for a single NDJSON line. Real packets are well below 100 bytes;
+# anything longer is treated as a broken client and the connection is closed.
+_MAX_LINE_LENGTH = 4096
+
+# Window in which pushes from one device are coalesced into a single entity
+# state write. Values are always stored immediately; entities are written at
+# most once per window with the freshest ones.
+_UPDATE_COALESCE_SECONDS = 0.25
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
@@ -61,10 +69,13 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         {
             "server": None,               # asyncio.Server
             "port": DEFAULT_PORT,         # configured listen port
+            "listener_entry_id": None,    # entry_id of the loaded listener entry
             "values": {},                 # device_id -> dict("t"/"h" -> float)
             "device_types": {},           # device_id -> type string
             "configured": set(),          # configured device_ids
             "discovery_started": set(),   # device_ids for which we already started discovery
+            "entities": {},               # device_id -> list of sensor entities to update
+            "pending_updates": {},        # device_id -> asyncio.TimerHandle of the scheduled entity update
         },
     )
     return True
@@ -78,6 +89,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         port = int(entry.data.get(CONF_PORT, DEFAULT_PORT))
         hass.data[DOMAIN]["port"] = port
         await _ensure_server_started(hass, port)
+        hass.data[DOMAIN]["listener_entry_id"] = entry.entry_id
         return True
 
     if entry_type == ENTRY_TYPE_DEVICE:
@@ -103,15 +115,29 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
         if ok and device_id:
             hass.data[DOMAIN]["configured"].discard(device_id)
+            pending = hass.data[DOMAIN]["pending_updates"].pop(device_id, None)
+            if pending is not None:
+                pending.cancel()
         return ok
 
     if entry_type == ENTRY_TYPE_LISTENER:
         await _stop_server(hass)
+        hass.data[DOMAIN]["listener_entry_id"] = None
         return True
 
     return False
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the cached state of a device whose entry was deleted."""
+    if entry.data.get(CONF_ENTRY_TYPE) != ENTRY_TYPE_DEVICE or DOMAIN not in hass.data:
+        return
+
+    device_id = str(entry.data.get(CONF_DEVICE_ID, ""))
+    hass.data[DOMAIN]["values"].pop(device_id, None)
+    hass.data[DOMAIN]["device_types"].pop(device_id, None)
+
+
 async def _ensure_server_started(hass: HomeAssistant, port: int) -> None:
     """Start the TCP server if it isn't running yet."""
     if hass.data[DOMAIN].get("server") is not None:
@@ -119,20 +145,30 @@ async def _ensure_server_started(hass: HomeAssistant, port: int) -> None:
 
     async def _client_connected(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
         peer = writer.get_extra_info("peername")
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            # Let the kernel notice devices that vanished without closing the
+            # connection (power loss, Wi-Fi drop) so this reader doesn't hang forever.
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
         try:
             while True:
-                line = await reader.readline()
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    _LOGGER.warning("Line from %s exceeds %s bytes, closing connection", peer, _MAX_LINE_LENGTH)
+                    break
                 if not line:
                     break  # client closed
 
-                raw = line.strip()
-                if not raw:
+                # JSON allows surrounding whitespace (incl. "\r\n"), so the line
+                # can be parsed as-is; only skip blank keep-alive lines.
+                if line.isspace():
                     continue
 
                 try:
-                    obj = json.loads(raw.decode("utf-8"))
+                    obj = json_loads(line)
                 except Exception:
-                    _LOGGER.warning("Invalid JSON from %s: %r", peer, raw[:200])
+                    _LOGGER.warning("Invalid JSON from %s: %r", peer, line[:200])
                     continue
 
                 await _handle_packet(hass, obj)
@@ -146,7 +182,9 @@ async def _ensure_server_started(hass: HomeAssistant, port: int) -> None:
             except Exception:
                 pass
 
-    server = await asyncio.start_server(_client_connected, host="0.0.0.0", port=port)
+    server = await asyncio.start_server(
+        _client_connected, host="0.0.0.0", port=port, limit=_MAX_LINE_LENGTH, backlog=_LISTEN_BACKLOG
+    )
     hass.data[DOMAIN]["server"] = server
     _LOGGER.info("MyDevice for DIY listening on TCP port %s", port)
 
@@ -163,46 +201,62 @@ async def _stop_server(hass: HomeAssistant) -> None:
     _LOGGER.info("MyDevice for DIY server stopped")
 
 
+def _handle_ht(values: dict[str, float], data: dict[str, Any]) -> None:
+    """Store temperature ("t") and humidity ("h") from an "ht" packet."""
+    if "t" in data:
+        try:
+            values["t"] = float(data["t"])
+        except Exception:
+            pass
+    if "h" in data:
+        try:
+            values["h"] = float(data["h"])
+        except Exception:
+            pass
+
+
+# device_type -> payload handler. Keep in sync with SUPPORTED_DEVICE_TYPES.
+_HANDLERS: dict[str, Callable[[dict[str, float], dict[str, Any]], None]] = {
+    "ht": _handle_ht,
+}
+
+
 async def _handle_packet(hass: HomeAssistant, obj: Any) -> None:
     """Validate and process a single packet."""
-    if not isinstance(obj, dict):
+    # Valid packets dominate, so optimize for the happy path and let a single
+    # except clause reject non-objects, missing keys and unhashable types.
+    # Debug level only: a misbehaving device would otherwise log on every packet.
+    try:
+        device_id = obj["device"]
+        device_type = obj["type"]
+        data = obj["data"]
+        handler = _HANDLERS.get(device_type)
+    except (TypeError, KeyError):
+        _LOGGER.debug("Malformed packet")
         return
 
-    device_id = obj.get("device")
-    device_type = obj.get("type")
-    data = obj.get("data")
-
-    if not isinstance(device_id, str) or not device_id:
-        _LOGGER.warning("Missing device id")
+    if handler is None:
+        _LOGGER.debug("Unsupported device type %s", device_type)
         return
-    if not isinstance(device_type, str) or device_type not in SUPPORTED_DEVICE_TYPES:
-        _LOGGER.warning("Unsupported device type %s", device_type)
+    if not device_id or not isinstance(device_id, str):
+        _LOGGER.debug("Missing device id")
         return
     if not isinstance(data, dict):
-        _LOGGER.warning("Missing device data")
+        _LOGGER.debug("Missing device data")
         return
 
-    # Store the last values we received.
-    values = hass.data[DOMAIN]["values"].setdefault(device_id, {})
-    hass.data[DOMAIN]["device_types"][device_id] = device_type
-
-    if device_type == "ht":
-        if "t" in data:
-            try:
-                values["t"] = float(data["t"])
-            except Exception:
-                pass
-        if "h" in data:
-            try:
-                values["h"] = float(data["h"])
-            except Exception:
-                pass
+    domain_data = hass.data[DOMAIN]
 
+    # Store the last values we received.
+    values = domain_data["values"].setdefault(device_id, {})
+    domain_data["device_types"][device_id] = device_type
+    handler(values, data)
 
     # Unknown device? Trigger discovery once so it appears under "Discovered".
-    if device_id not in hass.data[DOMAIN]["configured"]:
-        if device_id not in hass.data[DOMAIN]["discovery_started"]:
-            hass.data[DOMAIN]["discovery_started"].add(device_id)
+    if device_id not in domain_data["configured"]:
+        discovery_started = domain_data["discovery_started"]
+        if device_id not in discovery_started:
+            discovery_started.add(device_id)
             hass.async_create_task(
                 hass.config_entries.flow.async_init(
                     DOMAIN,
@@ -213,5 +267,21 @@ async def _handle_packet(hass: HomeAssistant, obj: Any) -> None:
             _LOGGER.info("Created discovery flow for %s (%s)", device_id, device_type)
         return
 
-    # Configured device -> tell the entities to update.
-    async_dispatcher_send(hass, _data_signal(device_id))
+    # Configured device -> schedule an entity update unless one is pending
+    # already; pushes within the window only refresh the stored values.
+    pending = domain_data["pending_updates"]
+    if device_id not in pending:
+        pending[device_id] = hass.loop.call_later(
+            _UPDATE_COALESCE_SECONDS, _async_flush_device_update, hass, device_id
+        )
+
+
+@callback
+def _async_flush_device_update(hass: HomeAssistant, device_id: str) -> None:
+    """Write the latest values of a device to its entities."""
+    domain_data = hass.data[DOMAIN]
+    domain_data["pending_updates"].pop(device_id, None)
+    # We are running in the event loop, so call the entities directly instead
+    # of going through the dispatcher.
+    for entity in domain_data["entities"].get(device_id, ()):
+        entity.async_handle_update()
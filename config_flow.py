@@ -31,6 +31,13 @@ from .const import (
 import logging
 _LOGGER = logging.getLogger(__name__)
 
+# Schemas never change, so build them once. Per-device defaults for the name
+# are filled in with add_suggested_values_to_schema().
+_USER_SCHEMA = vol.Schema(
+    {vol.Required(CONF_PORT, default=DEFAULT_PORT): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535))}
+)
+_NAME_SCHEMA = vol.Schema({vol.Required(CONF_NAME): str})
+
 
 class MyDeviceForDiyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle configuration for MyDevice for DIY."""
@@ -53,19 +60,20 @@ class MyDeviceForDiyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 data={CONF_ENTRY_TYPE: ENTRY_TYPE_LISTENER, CONF_PORT: port},
             )
 
-        schema = vol.Schema({vol.Required(CONF_PORT, default=DEFAULT_PORT): vol.Coerce(int)})
-        return self.async_show_form(step_id="user", data_schema=schema)
+        return self.async_show_form(step_id="user", data_schema=_USER_SCHEMA)
 
     async def async_step_integration_discovery(self, user_input=None) -> FlowResult:
         """Handle discovery + form submit in one step."""
 
-        # 1) If this call contains discovery fields, store them
+        # 1) If this call contains discovery fields, store them.
+        # _handle_packet only starts discovery for a non-empty string id and a
+        # supported type, so the values are used as-is.
         if isinstance(user_input, dict) and CONF_DEVICE_ID in user_input and CONF_DEVICE_TYPE in user_input:
-            self.context["device_id"] = str(user_input.get(CONF_DEVICE_ID, "")).strip()
-            self.context["device_type"] = str(user_input.get(CONF_DEVICE_TYPE, "")).strip().lower()
+            self.context["device_id"] = user_input[CONF_DEVICE_ID]
+            self.context["device_type"] = user_input[CONF_DEVICE_TYPE]
 
-        device_id = str(self.context.get("device_id", "")).strip()
-        device_type = str(self.context.get("device_type", "")).strip().lower()
+        device_id = self.context.get("device_id", "")
+        device_type = self.context.get("device_type", "")
 
         if not device_id or device_type not in SUPPORTED_DEVICE_TYPES:
             return self.async_abort(reason="not_supported")
@@ -76,7 +84,8 @@ class MyDeviceForDiyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         await self.async_set_unique_id(device_id)
         self._abort_if_unique_id_configured()
 
-        if not any(e.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_LISTENER for e in self._async_current_entries()):
+        # Discovery runs once per new device, so don't scan all entries here.
+        if self.hass.data.get(DOMAIN, {}).get("listener_entry_id") is None:
             return self.async_abort(reason="listener_missing")
 
         # 2) If this call contains the form submission (name), create entry
@@ -92,7 +101,7 @@ class MyDeviceForDiyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 },
             )
 
-        schema = vol.Schema({vol.Required(CONF_NAME, default=f"MyDevice {device_id}"): str})
+        schema = self.add_suggested_values_to_schema(_NAME_SCHEMA, {CONF_NAME: f"MyDevice {device_id}"})
         return self.async_show_form(step_id="integration_discovery", data_schema=schema)
 
 
@@ -115,5 +124,5 @@ class MyDeviceForDiyOptionsFlow(config_entries.OptionsFlow):
             return self.async_create_entry(title="", data={CONF_NAME: str(user_input[CONF_NAME])})
 
         current_name = self.entry.options.get(CONF_NAME, self.entry.data.get(CONF_NAME, self.entry.title))
-        schema = vol.Schema({vol.Required(CONF_NAME, default=current_name): str})
+        schema = self.add_suggested_values_to_schema(_NAME_SCHEMA, {CONF_NAME: current_name})
         return self.async_show_form(step_id="init", data_schema=schema)
@@ -17,7 +17,4 @@ CONF_DEVICE_TYPE = "device_type"      # device-type-id (currently only "ht")
 CONF_NAME = "name"                    # friendly name in HA
 
 # Supported device types
-SUPPORTED_DEVICE_TYPES = {"ht"}
-
-# Dispatcher signal prefix. Full signal is f"{SIGNAL_DATA_RECEIVED}_{device_id}".
-SIGNAL_DATA_RECEIVED = f"{DOMAIN}_data_received"
+SUPPORTED_DEVICE_TYPES = frozenset({"ht"})
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -10,7 +13,6 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import (
@@ -20,12 +22,14 @@ from .const import (
     CONF_NAME,
     DOMAIN,
     ENTRY_TYPE_DEVICE,
-    SIGNAL_DATA_RECEIVED,
 )
 
+# Returned for devices that have not sent any values yet.
+_NO_VALUES: Mapping[str, float] = MappingProxyType({})
 
-def _data_signal(device_id: str) -> str:
-    return f"{SIGNAL_DATA_RECEIVED}_{device_id}"
+# Shared by the DeviceInfo of every device.
+_MANUFACTURER = "MyDevice for DIY"
+_MODEL = "TCP JSON Push"
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
@@ -37,60 +41,73 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     device_type = str(entry.data[CONF_DEVICE_TYPE])
     name = str(entry.options.get(CONF_NAME, entry.data.get(CONF_NAME, entry.title)))
 
-    entities: list[SensorEntity] = []
-
-    # Currently only the "ht" device type is supported.
-    if device_type == "ht":
-        entities.append(_TemperatureSensor(hass, device_id, name))
-        entities.append(_HumiditySensor(hass, device_id, name))
-
-    async_add_entities(entities)
+    # All sensors of a device share the integration's values map.
+    values = hass.data[DOMAIN]["values"]
+    async_add_entities(
+        [cls(values, device_id, name) for cls in _SENSOR_CLASSES.get(device_type, ())]
+    )
 
 
 class _BaseMyDeviceSensor(SensorEntity):
-    """Base class that pulls the latest value from hass.data and updates via dispatcher."""
+    """Base class that pulls the latest value from hass.data and is updated by _handle_packet."""
 
-    def __init__(self, hass: HomeAssistant, device_id: str, base_name: str) -> None:
-        self.hass = hass
+    # Entity itself keeps a __dict__ (HA's _attr_* caching relies on it);
+    # slot only the fields this integration adds.
+    __slots__ = ("_device_id", "_base_name", "_last_value", "_values")
+
+    def __init__(self, values: dict[str, dict[str, float]], device_id: str, base_name: str) -> None:
+        self._values = values
         self._device_id = device_id
         self._base_name = base_name
-        self._unsub = None
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        # This groups the sensors into one HA device.
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=self._base_name,
-            manufacturer="MyDevice for DIY",
-            model="TCP JSON Push",
+        self._last_value = None
+        # This groups the sensors into one HA device. It never changes, so
+        # build it once instead of on every device_info access.
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device_id)},
+            name=base_name,
+            manufacturer=_MANUFACTURER,
+            model=_MODEL,
         )
 
     async def async_added_to_hass(self) -> None:
-        # Update when new data arrives.
-        self._unsub = async_dispatcher_connect(self.hass, _data_signal(self._device_id), self._handle_update)
-        self._handle_update()
+        # Register so _handle_packet can update us directly when new data arrives.
+        self.hass.data[DOMAIN]["entities"].setdefault(self._device_id, []).append(self)
+        # HA writes the initial state right after this returns; remember what
+        # it will write so an identical first push is skipped.
+        self._last_value = self.native_value
 
     async def async_will_remove_from_hass(self) -> None:
-        if self._unsub is not None:
-            self._unsub()
-            self._unsub = None
+        entities = self.hass.data[DOMAIN]["entities"]
+        registered = entities.get(self._device_id)
+        if registered is not None and self in registered:
+            registered.remove(self)
+            if not registered:
+                del entities[self._device_id]
 
     @callback
-    def _handle_update(self) -> None:
+    def async_handle_update(self) -> None:
+        """Write the latest value received for this device."""
+        # Devices push at a fixed rate, mostly repeating the last value; only
+        # write state (and wake the recorder) when it actually changed.
+        value = self.native_value
+        if value == self._last_value:
+            return
+        self._last_value = value
         self.async_write_ha_state()
 
     def _get_value(self, key: str):
-        return self.hass.data[DOMAIN]["values"].get(self._device_id, {}).get(key)
+        return self._values.get(self._device_id, _NO_VALUES).get(key)
 
 
 class _TemperatureSensor(_BaseMyDeviceSensor):
+    __slots__ = ()
+
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def __init__(self, hass: HomeAssistant, device_id: str, base_name: str) -> None:
-        super().__init__(hass, device_id, base_name)
+    def __init__(self, values: dict[str, dict[str, float]], device_id: str, base_name: str) -> None:
+        super().__init__(values, device_id, base_name)
         self._attr_unique_id = f"{device_id}_t"
         self._attr_name = f"{base_name} Temperature"
 
@@ -100,15 +117,23 @@ class _TemperatureSensor(_BaseMyDeviceSensor):
 
 
 class _HumiditySensor(_BaseMyDeviceSensor):
+    __slots__ = ()
+
     _attr_device_class = SensorDeviceClass.HUMIDITY
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def __init__(self, hass: HomeAssistant, device_id: str, base_name: str) -> None:
-        super().__init__(hass, device_id, base_name)
+    def __init__(self, values: dict[str, dict[str, float]], device_id: str, base_name: str) -> None:
+        super().__init__(values, device_id, base_name)
         self._attr_unique_id = f"{device_id}_h"
         self._attr_name = f"{base_name} Humidity"
 
     @property
     def native_value(self):
         return self._get_value("h")
+
+
+# device_type -> sensor classes created for it.
+_SENSOR_CLASSES: dict[str, tuple[type[_BaseMyDeviceSensor], ...]] = {
+    "ht": (_TemperatureSensor, _HumiditySensor),
+}